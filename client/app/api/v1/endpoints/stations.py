@@ -1,13 +1,16 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 import logging
 
 from client.app.schemas.station import (
     ReservationRequest,
     ReservationResponse,
-    StationList
+    StationList,
+    AdmissionMetrics
 )
 from client.app.services.server_communication import server_communication
 from client.app.services.mqtt_service import mqtt_service
+from client.app.services.admission_control import admission_control
+from client.app.core.config import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -64,6 +67,9 @@ async def get_all_stations():
     O processo de reserva é atômico, garantindo que apenas um cliente possa
     reservar uma estação específica em um determinado horário.
     
+    Requisições acima do limite de taxa do cliente ou da capacidade do sistema
+    são rejeitadas com status 429 e o cabeçalho Retry-After.
+    
     Parameters:
         reservation (ReservationRequest): Dados da solicitação de reserva
         
@@ -76,12 +82,37 @@ async def get_all_stations():
             
     Raises:
         HTTPException: Em caso de erro durante o processo de reserva
+        RateLimitExceededException: Se o cliente ou o sistema estiver sobrecarregado
     """
 )
-async def reserve_station(reservation: ReservationRequest):
+async def reserve_station(reservation: ReservationRequest, request: Request):
     """
     Endpoint para reservar uma estação de carregamento.
     
+    Args:
+        reservation (ReservationRequest): Dados da reserva
+        request (Request): Requisição HTTP, usada para identificar o cliente
+        
+    Returns:
+        ReservationResponse: Resultado da tentativa de reserva
+    """
+    if settings.RATE_LIMIT_KEY == "user_name":
+        client_key = reservation.user_name
+    elif request.client:
+        client_key = request.client.host
+    else:
+        logger.warning("Endereço do cliente indisponível, usando limite compartilhado")
+        client_key = "unknown"
+    admission_control.check_rate_limit(client_key)
+
+    async with admission_control.slot(client_key):
+        return await _process_reservation(reservation)
+
+
+async def _process_reservation(reservation: ReservationRequest) -> ReservationResponse:
+    """
+    Publica a reserva via MQTT e tenta realizá-la em todos os servidores.
+    
     Args:
         reservation (ReservationRequest): Dados da reserva
         
@@ -131,3 +162,28 @@ async def reserve_station(reservation: ReservationRequest):
             status_code=500,
             detail="Erro ao realizar reserva"
         )
+
+
+@router.get(
+    "/stations/admission",
+    response_model=AdmissionMetrics,
+    summary="Métricas do controle de admissão",
+    description="""
+    Retorna os contadores do controle de admissão da rota de reservas, incluindo:
+    - Requisições admitidas
+    - Requisições descartadas por limite de taxa, fila cheia ou tempo de espera
+    - Tempo de espera na fila (total, médio e máximo)
+    - Reservas em andamento e aguardando na fila
+    
+    Returns:
+        AdmissionMetrics: Métricas atuais do controle de admissão
+    """
+)
+async def get_admission_metrics():
+    """
+    Endpoint para consultar as métricas do controle de admissão.
+    
+    Returns:
+        AdmissionMetrics: Métricas atuais do controle de admissão
+    """
+    return AdmissionMetrics(**admission_control.get_metrics())
@@ -1,7 +1,7 @@
-from typing import List
+from typing import List, Literal
 import os
 from dotenv import load_dotenv
-from pydantic.v1 import BaseSettings
+from pydantic.v1 import BaseSettings, confloat, conint
 
 load_dotenv()
 
@@ -19,6 +19,15 @@ class Settings(BaseSettings):
     MQTT_PORT: int = int(os.getenv("MQTT_PORT", "1883"))
     MQTT_CLIENT_ID: str = os.getenv("MQTT_CLIENT_ID", "client_api")
 
+    # Configurações de controle de admissão (rate limiting)
+    RATE_LIMIT_KEY: Literal["client", "user_name"] = os.getenv("RATE_LIMIT_KEY", "client")
+    RATE_LIMIT_RATE: confloat(gt=0) = float(os.getenv("RATE_LIMIT_RATE", "1.0"))  # tokens por segundo
+    RATE_LIMIT_BURST: conint(gt=0) = int(os.getenv("RATE_LIMIT_BURST", "5"))
+    RATE_LIMIT_MAX_BUCKETS: conint(gt=0) = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", "10000"))
+    ADMISSION_MAX_CONCURRENCY: conint(gt=0) = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "10"))
+    ADMISSION_MAX_QUEUE: conint(ge=0) = int(os.getenv("ADMISSION_MAX_QUEUE", "50"))
+    ADMISSION_QUEUE_TIMEOUT: confloat(gt=0) = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "2.0"))
+
     # Lista de servidores disponíveis
     AVAILABLE_SERVERS: List[str] = [
         "http://server1:8001",
@@ -28,6 +37,7 @@ class Settings(BaseSettings):
 
     class Config:
         case_sensitive = True
+        validate_all = True
 
 
 settings = Settings()
@@ -42,3 +42,12 @@ class InvalidReservationDataException(BaseAPIException):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=detail
         )
+
+
+class RateLimitExceededException(BaseAPIException):
+    def __init__(self, detail: str, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)}
+        )
@@ -108,3 +108,31 @@ class StationList(BaseModel):
     """
     stations: List[StationResponse] = Field(..., description="Lista de estações")
     total: int = Field(..., description="Total de estações na lista")
+
+
+class AdmissionMetrics(BaseModel):
+    """
+    Modelo para as métricas do controle de admissão da rota de reservas.
+    
+    Attributes:
+        admitted (int): Requisições admitidas
+        shed_rate_limited (int): Requisições descartadas pelo limite de taxa do cliente
+        shed_queue_full (int): Requisições descartadas por fila cheia
+        shed_queue_timeout (int): Requisições descartadas por tempo de espera esgotado
+        queue_wait_total_seconds (float): Tempo total de espera na fila das requisições admitidas
+        queue_wait_max_seconds (float): Maior tempo de espera na fila
+        queue_wait_avg_seconds (float): Tempo médio de espera na fila
+        in_flight (int): Reservas em andamento
+        waiting (int): Requisições aguardando na fila
+        tracked_clients (int): Clientes com balde de tokens ativo
+    """
+    admitted: int = Field(..., description="Requisições admitidas")
+    shed_rate_limited: int = Field(..., description="Requisições descartadas pelo limite de taxa do cliente")
+    shed_queue_full: int = Field(..., description="Requisições descartadas por fila cheia")
+    shed_queue_timeout: int = Field(..., description="Requisições descartadas por tempo de espera esgotado")
+    queue_wait_total_seconds: float = Field(..., description="Tempo total de espera na fila das requisições admitidas")
+    queue_wait_max_seconds: float = Field(..., description="Maior tempo de espera na fila")
+    queue_wait_avg_seconds: float = Field(..., description="Tempo médio de espera na fila")
+    in_flight: int = Field(..., description="Reservas em andamento")
+    waiting: int = Field(..., description="Requisições aguardando na fila")
+    tracked_clients: int = Field(..., description="Clientes com balde de tokens ativo")
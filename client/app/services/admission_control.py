@@ -0,0 +1,257 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, Tuple, Union
+import logging
+
+from client.app.core.config import settings
+from client.app.core.exceptions import RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Balde de tokens usado para limitar a taxa de requisições de um cliente.
+
+    Attributes:
+        rate (float): Quantidade de tokens repostos por segundo
+        capacity (int): Quantidade máxima de tokens (tamanho da rajada)
+        tokens (float): Tokens disponíveis no momento
+        updated_at (float): Instante (monotônico) da última reposição
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Inicializa o balde cheio.
+
+        Args:
+            rate (float): Tokens repostos por segundo
+            capacity (int): Capacidade máxima do balde
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def consume(self) -> Tuple[bool, float]:
+        """
+        Tenta consumir um token do balde.
+
+        Returns:
+            Tuple[bool, float]: Se o token foi consumido e, caso contrário,
+            quantos segundos faltam para haver um token disponível
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (1 - self.tokens) / self.rate
+
+    def refund(self):
+        """
+        Devolve um token consumido por uma requisição que não foi atendida.
+        """
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class AdmissionControlService:
+    """
+    Serviço de controle de admissão para as rotas de reserva.
+
+    Cada reserva gera uma publicação MQTT e uma requisição HTTP para cada
+    servidor configurado. Este serviço protege os servidores de estações
+    combinando:
+    - Limite de taxa por cliente (balde de tokens por `user_name` ou IP)
+    - Limite global de fan-outs simultâneos, com fila de espera limitada
+    - Rejeição rápida com 429 e cabeçalho Retry-After quando há sobrecarga
+
+    Attributes:
+        buckets (OrderedDict[str, TokenBucket]): Baldes de tokens por cliente,
+            em ordem de uso (LRU)
+        semaphore (asyncio.Semaphore): Limita os fan-outs em andamento
+        occupancy (int): Requisições em andamento somadas às que estão na fila
+        in_flight (int): Quantidade de fan-outs em andamento
+        metrics (Dict[str, Union[int, float]]): Contadores de admissão e descarte
+    """
+
+    def __init__(
+            self,
+            rate: Optional[float] = None,
+            burst: Optional[int] = None,
+            max_buckets: Optional[int] = None,
+            max_concurrency: Optional[int] = None,
+            max_queue: Optional[int] = None,
+            queue_timeout: Optional[float] = None
+    ):
+        """
+        Inicializa o serviço. Parâmetros omitidos usam as configurações de
+        admissão definidas em `settings`.
+
+        Raises:
+            ValueError: Se algum limite estiver fora do intervalo permitido
+        """
+        self.rate = settings.RATE_LIMIT_RATE if rate is None else rate
+        self.burst = settings.RATE_LIMIT_BURST if burst is None else burst
+        self.max_buckets = settings.RATE_LIMIT_MAX_BUCKETS if max_buckets is None else max_buckets
+        self.max_concurrency = (
+            settings.ADMISSION_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        )
+        self.max_queue = settings.ADMISSION_MAX_QUEUE if max_queue is None else max_queue
+        self.queue_timeout = (
+            settings.ADMISSION_QUEUE_TIMEOUT if queue_timeout is None else queue_timeout
+        )
+        if min(self.rate, self.burst, self.max_buckets, self.max_concurrency, self.queue_timeout) <= 0:
+            raise ValueError("Os limites de admissão devem ser maiores que zero")
+        if self.max_queue < 0:
+            raise ValueError("O tamanho da fila de admissão não pode ser negativo")
+
+        self.buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.occupancy = 0
+        self.in_flight = 0
+        self.metrics: Dict[str, Union[int, float]] = {
+            "admitted": 0,
+            "shed_rate_limited": 0,
+            "shed_queue_full": 0,
+            "shed_queue_timeout": 0,
+            "queue_wait_total_seconds": 0.0,
+            "queue_wait_max_seconds": 0.0,
+        }
+
+    def check_rate_limit(self, client_key: str):
+        """
+        Consome um token do balde do cliente.
+
+        Args:
+            client_key (str): Identificador do cliente (`user_name` ou IP)
+
+        Raises:
+            RateLimitExceededException: Se o cliente excedeu sua taxa
+        """
+        bucket = self.buckets.get(client_key)
+        if bucket is None:
+            # Descarta o cliente usado há mais tempo para manter o limite de memória
+            if len(self.buckets) >= self.max_buckets:
+                self.buckets.popitem(last=False)
+            bucket = TokenBucket(self.rate, self.burst)
+            self.buckets[client_key] = bucket
+        else:
+            self.buckets.move_to_end(client_key)
+
+        allowed, wait = bucket.consume()
+        if not allowed:
+            self.metrics["shed_rate_limited"] += 1
+            logger.warning(f"Limite de taxa excedido para o cliente {client_key}")
+            raise RateLimitExceededException(
+                "Limite de requisições excedido, tente novamente mais tarde",
+                retry_after=max(1, math.ceil(wait)) if math.isfinite(wait) else 60
+            )
+
+    def refund(self, client_key: str):
+        """
+        Devolve ao cliente o token consumido por uma requisição descartada
+        por falta de capacidade, para que ela não conte contra o seu limite.
+
+        Args:
+            client_key (str): Identificador do cliente (`user_name` ou IP)
+        """
+        bucket = self.buckets.get(client_key)
+        if bucket is not None:
+            bucket.refund()
+
+    @asynccontextmanager
+    async def slot(self, client_key: Optional[str] = None):
+        """
+        Reserva uma vaga no limite global de fan-outs simultâneos.
+
+        Se não houver vaga, a requisição aguarda na fila por até
+        `ADMISSION_QUEUE_TIMEOUT` segundos. Requisições que encontram a fila
+        cheia ou que esgotam o tempo de espera são descartadas. A ocupação é
+        reservada antes do primeiro `await`, de modo que o limite da fila vale
+        também para rajadas simultâneas.
+
+        Args:
+            client_key (Optional[str]): Cliente cujo token é devolvido caso a
+                requisição seja descartada
+
+        Raises:
+            RateLimitExceededException: Se a fila estiver cheia ou o tempo de
+            espera se esgotar
+        """
+        retry_after = max(1, math.ceil(self.queue_timeout))
+        if self.occupancy >= self.max_concurrency + self.max_queue:
+            self.metrics["shed_queue_full"] += 1
+            logger.warning("Fila de admissão cheia, requisição descartada")
+            if client_key is not None:
+                self.refund(client_key)
+            raise RateLimitExceededException(
+                "Sistema sobrecarregado, tente novamente mais tarde",
+                retry_after=retry_after
+            )
+
+        self.occupancy += 1
+        try:
+            started_at = time.monotonic()
+            if self.semaphore.locked():
+                try:
+                    async with asyncio.timeout(self.queue_timeout):
+                        await self.semaphore.acquire()
+                except TimeoutError:
+                    self.metrics["shed_queue_timeout"] += 1
+                    logger.warning("Tempo de espera na fila de admissão esgotado")
+                    if client_key is not None:
+                        self.refund(client_key)
+                    raise RateLimitExceededException(
+                        "Sistema sobrecarregado, tente novamente mais tarde",
+                        retry_after=retry_after
+                    )
+            else:
+                # Há vaga livre: acquire() retorna sem suspender a tarefa
+                await self.semaphore.acquire()
+
+            wait = time.monotonic() - started_at
+            self.metrics["admitted"] += 1
+            self.metrics["queue_wait_total_seconds"] += wait
+            self.metrics["queue_wait_max_seconds"] = max(
+                self.metrics["queue_wait_max_seconds"], wait
+            )
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                self.semaphore.release()
+        finally:
+            self.occupancy -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Retorna o estado atual do controle de admissão.
+
+        Returns:
+            Dict[str, Any]: Contadores de admissão, descarte e tempo de fila
+        """
+        admitted = self.metrics["admitted"]
+        return {
+            **self.metrics,
+            "queue_wait_avg_seconds": (
+                self.metrics["queue_wait_total_seconds"] / admitted if admitted else 0.0
+            ),
+            "in_flight": self.in_flight,
+            "waiting": self.occupancy - self.in_flight,
+            "tracked_clients": len(self.buckets),
+        }
+
+
+admission_control = AdmissionControlService()
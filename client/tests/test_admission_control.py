@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from client.app.core.exceptions import RateLimitExceededException
+from client.app.services.admission_control import AdmissionControlService, TokenBucket
+
+
+def test_token_bucket_exhausts_and_refills():
+    bucket = TokenBucket(rate=0.5, capacity=2)
+    assert bucket.consume()[0]
+    assert bucket.consume()[0]
+
+    allowed, wait = bucket.consume()
+    assert not allowed
+    assert wait == pytest.approx(2.0, abs=0.01)
+
+    # Simula a passagem de 2 segundos: um token é reposto
+    bucket.updated_at -= 2
+    assert bucket.consume()[0]
+    assert not bucket.consume()[0]
+
+
+def test_rate_limit_sets_retry_after():
+    service = AdmissionControlService(rate=0.5, burst=1)
+    service.check_rate_limit("alice")
+
+    with pytest.raises(RateLimitExceededException) as exc_info:
+        service.check_rate_limit("alice")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "2"}
+    assert service.metrics["shed_rate_limited"] == 1
+    # Outros clientes não são afetados
+    service.check_rate_limit("bob")
+
+
+def test_bucket_limit_holds():
+    service = AdmissionControlService(max_buckets=10)
+    for i in range(100):
+        service.check_rate_limit(f"user-{i}")
+
+    assert len(service.buckets) == 10
+    assert list(service.buckets) == [f"user-{i}" for i in range(90, 100)]
+
+
+def test_bucket_limit_evicts_least_recently_used():
+    service = AdmissionControlService(max_buckets=2)
+    service.check_rate_limit("a")
+    service.check_rate_limit("b")
+    service.check_rate_limit("a")
+    service.check_rate_limit("c")
+
+    assert list(service.buckets) == ["a", "c"]
+
+
+@pytest.mark.parametrize("limits", [
+    {"max_buckets": 0},
+    {"max_concurrency": 0},
+    {"max_concurrency": -1},
+    {"rate": 0},
+    {"burst": 0},
+    {"queue_timeout": 0},
+    {"max_queue": -1},
+])
+def test_rejects_invalid_limits(limits):
+    with pytest.raises(ValueError):
+        AdmissionControlService(**limits)
+
+
+async def _hold_slot(service, release):
+    try:
+        async with service.slot():
+            await release.wait()
+        return "ok"
+    except RateLimitExceededException:
+        return "shed"
+
+
+def test_queue_full_sheds_simultaneous_burst():
+    async def scenario():
+        service = AdmissionControlService(max_concurrency=1, max_queue=2, queue_timeout=5)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(_hold_slot(service, release)) for _ in range(100)]
+        await asyncio.sleep(0)
+        assert service.occupancy == 3
+        release.set()
+        return service, await asyncio.gather(*tasks)
+
+    service, results = asyncio.run(scenario())
+
+    assert results.count("ok") == 3
+    assert service.metrics["shed_queue_full"] == 97
+    assert service.metrics["shed_queue_timeout"] == 0
+    assert service.occupancy == 0
+    assert service.in_flight == 0
+
+
+def test_queue_timeout_sheds_and_releases_capacity():
+    async def scenario():
+        service = AdmissionControlService(max_concurrency=1, max_queue=5, queue_timeout=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold_slot(service, release))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            async with service.slot():
+                pass
+
+        release.set()
+        assert await holder == "ok"
+        # A vaga volta a ficar disponível após o descarte por tempo esgotado
+        async with service.slot():
+            pass
+        return service, exc_info.value
+
+    service, exc = asyncio.run(scenario())
+
+    assert exc.headers == {"Retry-After": "1"}
+    assert service.metrics["shed_queue_timeout"] == 1
+    assert service.metrics["admitted"] == 2
+    assert service.occupancy == 0
+    assert not service.semaphore.locked()
+
+
+def test_shed_request_refunds_client_token():
+    async def scenario():
+        service = AdmissionControlService(rate=0.01, burst=1, max_concurrency=1, max_queue=0)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold_slot(service, release))
+        await asyncio.sleep(0)
+
+        service.check_rate_limit("alice")
+        with pytest.raises(RateLimitExceededException):
+            async with service.slot("alice"):
+                pass
+
+        # O token foi devolvido: a nova tentativa não é barrada pelo limite de taxa
+        service.check_rate_limit("alice")
+        release.set()
+        await holder
+        return service
+
+    service = asyncio.run(scenario())
+
+    assert service.metrics["shed_queue_full"] == 1
+    assert service.metrics["shed_rate_limited"] == 0
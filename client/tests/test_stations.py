@@ -0,0 +1,55 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from client.app.api.v1.api import api_router
+from client.app.api.v1.endpoints import stations
+from client.app.services.admission_control import AdmissionControlService
+
+RESERVATION = {
+    "station_id": 1,
+    "user_name": "alice",
+    "reservation_date": "2026-10-19T10:00:00",
+    "server_origin": "server1",
+}
+
+
+def _make_client(monkeypatch):
+    published = []
+
+    async def broadcast_reservation(reservation_data):
+        return [{"success": True, "reservation_id": "r-1"}]
+
+    monkeypatch.setattr(stations.mqtt_service, "publish", lambda topic, message: published.append(topic))
+    monkeypatch.setattr(stations.server_communication, "broadcast_reservation", broadcast_reservation)
+    monkeypatch.setattr(stations, "admission_control", AdmissionControlService(rate=0.5, burst=1))
+
+    app = FastAPI()
+    app.include_router(api_router, prefix="/api/v1")
+    return TestClient(app), published
+
+
+def test_reserve_returns_429_with_retry_after(monkeypatch):
+    client, published = _make_client(monkeypatch)
+
+    response = client.post("/api/v1/stations/stations/reserve", json=RESERVATION)
+    assert response.status_code == 200
+    assert response.json()["reservation_id"] == "r-1"
+
+    response = client.post("/api/v1/stations/stations/reserve", json=RESERVATION)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2"
+    # A requisição rejeitada não gera publicação MQTT nem fan-out
+    assert published == ["stations/reserve"]
+
+
+def test_admission_metrics(monkeypatch):
+    client, _ = _make_client(monkeypatch)
+    client.post("/api/v1/stations/stations/reserve", json=RESERVATION)
+    client.post("/api/v1/stations/stations/reserve", json=RESERVATION)
+
+    response = client.get("/api/v1/stations/stations/admission")
+    assert response.status_code == 200
+    metrics = response.json()
+    assert metrics["admitted"] == 1
+    assert metrics["shed_rate_limited"] == 1
+    assert metrics["in_flight"] == 0